@@ -3,33 +3,60 @@
 PostgreSQL Helper Functions
 A collection of utilities for PostgreSQL database operations and data analysis.
 """
-
-from .database import (
-    createPostgresqlEngine,
-    createPostgresqlEngineWithCustomSSL,
-    dataGrabber,
-    recursiveDataGrabber,
-    check_ssl_connection,
-    diagnose_connection_and_query
-)
-from .query_utils import (
-    listPrep,
-    queryCleaner
-)
-from .notifications import play_notification_sound
+import importlib
 
 __version__ = "1.3.5"
 __author__ = "Chris Leonard"
 
+# Public name -> defining submodule. Submodules (and pandas/SQLAlchemy with them)
+# are imported on first attribute access via __getattr__ (PEP 562), so a bare
+# `import pg_helpers` stays cheap.
+_EXPORTS = {
+    'createPostgresqlEngine': 'database',
+    'createPostgresqlEngineWithCustomSSL': 'database',
+    'reset_engine': 'database',
+    'dataGrabber': 'database',
+    'recursiveDataGrabber': 'database',
+    'asyncDataGrabber': 'database',
+    'dataPusher': 'database',
+    'clear_query_cache': 'database',
+    'check_ssl_connection': 'database',
+    'diagnose_connection_and_query': 'database',
+    'listPrep': 'query_utils',
+    'queryCleaner': 'query_utils',
+    'play_notification_sound': 'notifications'
+}
+
+# Submodules reachable as pg_helpers.<name> without importing them explicitly
+_SUBMODULES = frozenset({'config', 'database', 'notifications', 'query_utils'})
+
 # Make main functions available at package level
 __all__ = [
     'createPostgresqlEngine',
     'createPostgresqlEngineWithCustomSSL',
+    'reset_engine',
     'dataGrabber',
     'recursiveDataGrabber',
+    'asyncDataGrabber',
+    'dataPusher',
+    'clear_query_cache',
     'check_ssl_connection',
     'diagnose_connection_and_query',
     'listPrep',
     'queryCleaner',
     'play_notification_sound'
 ]
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(f'.{_EXPORTS[name]}', __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # cache so later lookups skip __getattr__
+        return value
+    if name in _SUBMODULES:
+        # Importing a submodule binds it as a package attribute
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
@@ -1,6 +1,7 @@
 ### pg_helpers/config.py
 """Configuration and environment handling"""
 from __future__ import annotations
+import functools
 import os
 from pathlib import Path
 from dotenv import load_dotenv
@@ -51,8 +52,15 @@ def load_env_with_fallback() -> None:
 # Load environment variables when module is imported
 load_env_with_fallback()
 
+@functools.lru_cache(maxsize=1)
 def get_db_config() -> dict:
-    """Get database configuration from environment variables"""
+    """
+    Get database configuration from environment variables.
+
+    The environment is read once and the resulting dict is cached (treat it as
+    read-only). Call get_db_config.cache_clear() after changing DB_* variables
+    at runtime.
+    """
     return {
         'user': os.getenv('DB_USER'),
         'password': os.getenv('DB_PASSWORD'),
@@ -62,7 +70,8 @@ def get_db_config() -> dict:
         'ssl_mode': os.getenv('DB_SSL_MODE', 'require'),
         'ssl_ca_cert': os.getenv('DB_SSL_CA_CERT'),  # Optional CA certificate path
         'ssl_cert': os.getenv('DB_SSL_CERT'),        # Optional client certificate
-        'ssl_key': os.getenv('DB_SSL_KEY')           # Optional client key
+        'ssl_key': os.getenv('DB_SSL_KEY'),          # Optional client key
+        'statement_timeout_ms': os.getenv('DB_STATEMENT_TIMEOUT_MS')  # Optional per-query timeout
     }
 
 def validate_db_config() -> dict:
@@ -83,6 +92,9 @@ def validate_db_config() -> dict:
     if config['ssl_key'] and not os.path.exists(config['ssl_key']):
         raise ValueError(f"SSL client key file not found: {config['ssl_key']}")
     
+    if config['statement_timeout_ms'] and not config['statement_timeout_ms'].isdigit():
+        raise ValueError(f"DB_STATEMENT_TIMEOUT_MS must be a whole number of milliseconds, got {config['statement_timeout_ms']!r}")
+    
     return config
 
 def get_ssl_params() -> str:
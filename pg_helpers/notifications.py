@@ -4,6 +4,19 @@ from __future__ import annotations
 import os
 import sys
 
+def _notifications_enabled() -> bool:
+    """
+    Decide whether dataGrabber should play its completion sound
+
+    PG_HELPERS_NOTIFY=1 always plays it and PG_HELPERS_NOTIFY=0 never does. When
+    unset, the sound only plays in interactive sessions (a terminal, the Python
+    REPL or a Jupyter/IPython kernel), so batch, cron and CI runs skip it.
+    """
+    setting = os.environ.get('PG_HELPERS_NOTIFY')
+    if setting is not None:
+        return setting == '1'
+    return (sys.stdout is not None and sys.stdout.isatty()) or hasattr(sys, 'ps1') or 'IPython' in sys.modules
+
 def play_notification_sound() -> None:
     """
     Play notification sound based on operating system
@@ -1,6 +1,13 @@
 ### pg_helpers/query_utils.py
 """Query preparation and cleaning utilities"""
 from __future__ import annotations
+import functools
+import os
+import re
+
+# Template placeholders look like $IDS or $START_DATE. Uppercase only, and not
+# followed by $, so $1 parameters and $tag$ dollar quotes aren't mistaken for one.
+_PLACEHOLDER_RE = re.compile(r'(?<![\w$])\$[A-Z_][A-Z0-9_]*\b(?!\$)')
 
 def listPrep(iList: list | int | float | str) -> str:
     """
@@ -17,20 +24,30 @@ def listPrep(iList: list | int | float | str) -> str:
     if isinstance(iList, list) and len(iList) == 0:
         raise ValueError("listPrep received an empty list")
     if type(iList) == list:
-        if type(iList[0]) == int:
-            iStr = ','.join(str(x) for x in iList)
-        elif type(iList[0]) == float:
-            iStr = ','.join(str(x) for x in iList)
-        else:
-            iStr = '\',\''.join(str(x) for x in iList)
-            iStr = '\'' + iStr + '\''
-    else:
-        iStr = str(iList)
-    
-    return iStr
+        return _FORMATTERS.get(type(iList[0]), _format_quoted)(iList)
+    return str(iList)
+
+def _format_numbers(values: list) -> str:
+    """Format numbers as an unquoted comma-separated list"""
+    return ','.join(str(x) for x in values)
+
+def _format_quoted(values: list) -> str:
+    """Format values as a comma-separated list of quoted literals"""
+    try:
+        # Lists that are already all strings (the usual case) join directly,
+        # without a str() call per element
+        body = "','".join(values)
+    except TypeError:
+        body = "','".join(str(x) for x in values)
+    return "'" + body + "'"
+
+# listPrep formatter chosen by the exact type of the list's first element; any
+# other type (including bool and numpy scalars) is quoted
+_FORMATTERS = {int: _format_numbers, float: _format_numbers, str: _format_quoted}
 
 def queryCleaner(file: str, list1='empty', varString1: str = 'empty', list2='empty',
-                varString2: str = 'empty', startDate='START1', endDate='END1') -> str:
+                varString2: str = 'empty', startDate='START1', endDate='END1',
+                bind_lists: bool = False, batch_size: int | None = None) -> str | tuple[str, dict] | list[str]:
     """
     Clean and prepare SQL query by replacing placeholders with actual values
     
@@ -42,27 +59,124 @@ def queryCleaner(file: str, list1='empty', varString1: str = 'empty', list2='emp
         varString2 (str): Placeholder string for second list
         startDate: Start date value
         endDate: End date value
+        bind_lists (bool): Instead of inlining the lists, replace their placeholders
+            with %(list1)s / %(list2)s and return the lists as driver parameters,
+            so write the template as `WHERE id = ANY($IDS)`. psycopg2 quotes each
+            list as a typed ARRAY[...] literal (no listPrep string building or
+            quoting in Python), but it interpolates parameters client-side, so
+            the statement PostgreSQL parses still grows with the list; use
+            batch_size to cap statement size. Literal % signs in the file are
+            escaped as %%.
+        batch_size (int, optional): When list1 has more than batch_size values,
+            return one query per batch_size slice of it instead of a single
+            query, keeping each statement a manageable size. Pass the list to
+            dataGrabber, which runs the batches and concatenates the results.
         
     Returns:
-        str: Cleaned SQL query string
+        str: Cleaned SQL query string, or (query, params) when bind_lists=True;
+            pass params to dataGrabber(query, engine, params=params). A list of
+            query strings when list1 is split by batch_size
+    
+    Raises:
+        ValueError: If the file uses a $PLACEHOLDER that none of the arguments
+            fill (e.g. a misspelled or missing varString1), instead of sending
+            SQL that is certain to fail to the database, if batch_size is not a
+            positive integer, or if batch_size is combined with bind_lists
     """
-    with open(file, 'r', encoding='utf-8') as myFile:
-        query = myFile.read()
+    if batch_size is not None:
+        if isinstance(batch_size, bool) or not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError(f"batch_size must be a positive integer, got {batch_size!r}")
+        if bind_lists:
+            # Batches are plain query strings; they'd each need their own params
+            raise ValueError("batch_size can't be combined with bind_lists")
+        if isinstance(list1, list) and len(list1) > batch_size:
+            return [
+                queryCleaner(file, list1[i:i + batch_size], varString1, list2, varString2,
+                             startDate, endDate)
+                for i in range(0, len(list1), batch_size)
+            ]
+    
+    stat = os.stat(file)
+    query = _read_sql_file(file, stat.st_mtime_ns, stat.st_size)
+    
+    if list1 == 'empty' and list2 == 'empty' and startDate == 'START1' and not bind_lists:
+        # Nothing to substitute: return the (cached) file contents as-is
+        return query
     
+    template = query
+    params = {}
+    if bind_lists:
+        # With parameters, psycopg2 treats % as a placeholder marker
+        query = query.replace('%', '%%')
+    
+    # Placeholder -> replacement text, applied in a single pass over the query
+    subs = {}
     if list1 != 'empty':
-        list1IDs = listPrep(list1)
-        query = query.replace(varString1, list1IDs)
+        if bind_lists:
+            params['list1'] = _bindable(list1)
+            subs[varString1] = '%(list1)s'
+        else:
+            subs[varString1] = listPrep(list1)
     
     if list2 != 'empty':
-        list2IDs = listPrep(list2)
-        query = query.replace(varString2, list2IDs)
+        if bind_lists:
+            params['list2'] = _bindable(list2)
+            subs.setdefault(varString2, '%(list2)s')
+        else:
+            subs.setdefault(varString2, listPrep(list2))
     
     if startDate != 'START1':
         if type(startDate) == str:
             startDate = f"'{startDate}'"
             endDate = f"'{endDate}'"
         
-        query = query.replace('$START_DATE', str(startDate))
-        query = query.replace('$END_DATE', str(endDate))
+        startDate, endDate = str(startDate), str(endDate)
+        if bind_lists:
+            startDate, endDate = startDate.replace('%', '%%'), endDate.replace('%', '%%')
+        subs.setdefault('$START_DATE', startDate)
+        subs.setdefault('$END_DATE', endDate)
     
+    if subs:
+        unresolved = _template_placeholders(template) - subs.keys()
+        if unresolved:
+            raise ValueError(f"Unresolved placeholders in {file}: {', '.join(sorted(unresolved))}")
+        query = _substitution_pattern(tuple(subs)).sub(lambda m: subs[m.group(0)], query)
+    
+    if bind_lists:
+        return query, params
     return query
+
+@functools.lru_cache(maxsize=256)
+def _read_sql_file(file: str, mtime_ns: int, size: int) -> str:
+    """
+    Read a SQL file, cached on (path, modification time, size).
+
+    Repeated queryCleaner calls on an unchanged file skip the disk read; editing
+    the file changes its mtime/size and so misses the cache.
+    """
+    with open(file, 'r', encoding='utf-8') as myFile:
+        return myFile.read()
+
+@functools.lru_cache(maxsize=64)
+def _substitution_pattern(placeholders: tuple[str, ...]) -> re.Pattern:
+    """
+    Compile one regex matching any of the placeholders.
+
+    Longer placeholders are tried first, so '$IDS' can't match the start of
+    '$IDS2', and replacement text is never rescanned for other placeholders.
+    """
+    return re.compile('|'.join(re.escape(p) for p in sorted(placeholders, key=len, reverse=True)))
+
+@functools.lru_cache(maxsize=256)
+def _template_placeholders(query: str) -> frozenset[str]:
+    """Return the $PLACEHOLDER tokens used in a SQL template (see _PLACEHOLDER_RE)"""
+    return frozenset(_PLACEHOLDER_RE.findall(query))
+
+def _bindable(iList) -> list:
+    """Return iList as a list suitable for binding as a PostgreSQL array"""
+    if not isinstance(iList, list):
+        iList = [iList]
+    if len(iList) == 0:
+        # An empty array parameter has no element type for PostgreSQL to infer
+        raise ValueError("queryCleaner received an empty list")
+    return iList
@@ -29,17 +29,22 @@ setup(
         "test": [
             "pytest>=6.0",
             "pytest-cov>=2.10.0",
+            "pytest-xdist>=2.0",
             "coverage>=5.0",
         ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.10.0",
+            "pytest-xdist>=2.0",
             "coverage>=5.0",
             "flake8>=3.8.0",
             "black>=21.0.0",
             "tox>=3.20.0",
         ],
         "windows": ["winsound"],  # Windows-specific sound support
+        "arrow": ["pyarrow>=7.0"],  # COPY fast path, parquet checkpoints
+        "async": ["asyncpg>=0.27"],  # asyncDataGrabber
+        "connectorx": ["connectorx>=0.3"],  # dataGrabber(partition_on=...)
     },
     python_requires=">=3.8",  # Updated from 3.7 to match your testing
     classifiers=[